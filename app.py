@@ -1,9 +1,12 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import time
+from typing import Optional
+import html
+import io
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 # Page configuration - MUST be first Streamlit command
 st.set_page_config(
@@ -45,9 +48,10 @@ except ImportError as e:
 
 # Import filter after page config
 from filter import InternshipFilter
+from frame_utils import add_lowercase_columns, drop_lowercase_columns
 
 # Custom CSS for better styling
-st.markdown("""
+CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -75,7 +79,112 @@ st.markdown("""
         border-left: 4px solid #28a745;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Welcome message shown before the first search
+WELCOME_HTML = """
+<div style="text-align: center; padding: 2rem;">
+    <h2>Welcome to the Internship Recommendation Engine! 🎉</h2>
+    <p style="font-size: 1.2rem; color: #666;">
+        Get personalized internship recommendations based on your skills and preferences.
+    </p>
+    <p style="font-size: 1rem; color: #888;">
+        Fill out your profile on the left and click "Find My Internships" to get started!
+    </p>
+</div>
+"""
+
+# HTML template for a feature card on the welcome page
+FEATURE_CARD_TPL = """
+<div class="metric-card">
+    <h3>{title}</h3>
+    <p>{text}</p>
+</div>
+"""
+
+# HTML template for a single internship card
+CARD_TPL = """
+<div class="internship-card">
+    <h3 style="color: #1f77b4; margin-bottom: 0.5rem;">{title}</h3>
+    <p style="color: #666; margin-bottom: 0.5rem;"><strong>Company:</strong> {company}</p>
+    <p style="color: #666; margin-bottom: 0.5rem;"><strong>Location:</strong> {location}</p>
+    <p style="color: #666; margin-bottom: 0.5rem;"><strong>Stipend:</strong> ${stipend}</p>
+    <p style="color: #666; margin-bottom: 0.5rem;"><strong>Posted:</strong> {days_old} days ago</p>
+    <p style="color: #666; margin-bottom: 1rem;"><strong>Relevance Score:</strong> {relevance_score:.2f}/10</p>
+    <p style="margin-bottom: 1rem;">{description}...</p>
+    <a href="{apply_url}" target="_blank" style="background-color: #28a745; color: white; padding: 0.5rem 1rem; text-decoration: none; border-radius: 0.25rem; display: inline-block;">Apply Now</a>
+</div>
+"""
+
+# Columns that get a precomputed lowercase "<column>_lc" copy after scraping
+LOWERCASE_COLUMNS = ['company', 'location']
+
+def _html_text(value, default: str = '', max_length: Optional[int] = None) -> str:
+    """Escape a card field for HTML, substituting a default for missing values"""
+    text = default if pd.isna(value) else str(value)
+    return html.escape(text[:max_length])
+
+def _hash_frame(df: pd.DataFrame) -> bytes:
+    """Hash a DataFrame by content in one vectorized pass (used as a cache key)"""
+    return pd.util.hash_pandas_object(df, index=False).values.tobytes()
+
+@st.cache_resource
+def get_scraper():
+    """Return a shared scraper instance that survives reruns"""
+    return InternshipScraper()
+
+@st.cache_resource
+def get_filter() -> InternshipFilter:
+    """Return a shared filter instance so its lookup tables are built once"""
+    return InternshipFilter()
+
+@st.cache_data(ttl=1800, show_spinner=False, max_entries=128)
+def cached_scrape(skills_tuple: tuple, location: str, max_results: int) -> pd.DataFrame:
+    """Scrape internships, reusing results for identical (normalized) searches"""
+    df = get_scraper().scrape_internships(
+        skills=list(skills_tuple),
+        location=location,
+        max_results=max_results
+    )
+    
+    # Lowercased copies used for case-insensitive matching downstream
+    if not df.empty:
+        df = add_lowercase_columns(df, LOWERCASE_COLUMNS)
+    
+    return df
+
+# Apply custom CSS
+st.markdown(CSS, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize results to CSV bytes with pyarrow's native writer"""
+    # Internal lowercase helper columns are not part of the export
+    df = drop_lowercase_columns(df)
+    
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def summarize(df: pd.DataFrame) -> dict:
+    """Compute summary statistics once per result set"""
+    return get_filter().get_statistics(df)
+
+@st.cache_data(show_spinner=False, hash_funcs={
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df['stipend'], index=False).values.tobytes()
+})
+def stipend_hist(df: pd.DataFrame):
+    """Build the stipend histogram (cached on the stipend column only)"""
+    return px.histogram(df, x='stipend', nbins=20,
+                        title="Distribution of Stipends",
+                        labels={'stipend': 'Stipend ($)', 'count': 'Number of Internships'})
+
+@st.cache_data(show_spinner=False)
+def location_pie(location_counts: tuple):
+    """Build the location pie chart from (location, count) pairs"""
+    names, values = zip(*location_counts)
+    return px.pie(values=values, names=names, title="Top 10 Locations")
 
 def main():
     # Header
@@ -119,6 +228,9 @@ def main():
     
     # Main content area
     if search_button:
+        # A new search replaces any previously displayed results
+        st.session_state.pop('results', None)
+        
         if not skills_input.strip():
             st.error("⚠️ Please enter your skills to get personalized recommendations!")
             return
@@ -138,16 +250,15 @@ def main():
         # Show loading
         with st.spinner("🔍 Searching for the best internships for you..."):
             try:
-                # Initialize scraper and filter
-                scraper = InternshipScraper()
-                filter_engine = InternshipFilter()
+                # Get the shared filter
+                filter_engine = get_filter()
                 
-                # Scrape internships
+                # Scrape internships (cached on the normalized search inputs)
                 st.info("📡 Scraping latest internship data...")
-                internships = scraper.scrape_internships(
-                    skills=skills,
-                    location=location,
-                    max_results=num_results * 2  # Get more to filter later
+                internships = cached_scrape(
+                    tuple(dict.fromkeys(skill.lower() for skill in skills)),
+                    location.strip().lower(),
+                    num_results * 2  # Get more to filter later
                 )
                 
                 if internships.empty:
@@ -164,6 +275,10 @@ def main():
                     top_n=num_results
                 )
                 
+                # Keep results so later reruns can redisplay them without re-scraping
+                st.session_state['results'] = filtered_internships
+                st.session_state['skills'] = skills
+                
                 # Display results
                 display_results(filtered_internships, name, skills)
                 
@@ -171,47 +286,27 @@ def main():
                 st.error(f"❌ An error occurred: {str(e)}")
                 st.info("💡 Try adjusting your search parameters or try again later.")
     
+    elif 'results' in st.session_state:
+        # Redisplay the last search after unrelated widget interactions
+        display_results(st.session_state['results'], name, st.session_state['skills'])
+    
     else:
         # Welcome message
-        st.markdown("""
-        <div style="text-align: center; padding: 2rem;">
-            <h2>Welcome to the Internship Recommendation Engine! 🎉</h2>
-            <p style="font-size: 1.2rem; color: #666;">
-                Get personalized internship recommendations based on your skills and preferences.
-            </p>
-            <p style="font-size: 1rem; color: #888;">
-                Fill out your profile on the left and click "Find My Internships" to get started!
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(WELCOME_HTML, unsafe_allow_html=True)
         
         # Features section
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>🔍 Smart Scraping</h3>
-                <p>Automatically finds the latest internships from multiple sources</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_CARD_TPL.format(title="🔍 Smart Scraping", text="Automatically finds the latest internships from multiple sources"), unsafe_allow_html=True)
         
         with col2:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>🎯 Personalized Matching</h3>
-                <p>Matches internships based on your skills and preferences</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_CARD_TPL.format(title="🎯 Personalized Matching", text="Matches internships based on your skills and preferences"), unsafe_allow_html=True)
         
         with col3:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>📊 Smart Ranking</h3>
-                <p>Ranks opportunities by relevance, stipend, and recency</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_CARD_TPL.format(title="📊 Smart Ranking", text="Ranks opportunities by relevance, stipend, and recency"), unsafe_allow_html=True)
 
+@st.fragment
 def display_results(internships, name, skills):
     """Display the filtered internship results"""
     
@@ -226,39 +321,36 @@ def display_results(internships, name, skills):
         st.markdown('<h2 class="sub-header">🎯 Your Recommended Internships</h2>', unsafe_allow_html=True)
     
     # Summary metrics
+    stats = summarize(internships)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Found", len(internships))
+        st.metric("Total Found", stats['total_internships'])
     
     with col2:
-        avg_stipend = internships['stipend'].mean() if 'stipend' in internships.columns else 0
-        st.metric("Avg Stipend", f"${avg_stipend:.0f}")
+        st.metric("Avg Stipend", f"${stats['avg_stipend']:.0f}")
     
     with col3:
-        remote_count = len(internships[internships['location'].astype(str).str.contains('Remote', case=False, na=False)])
-        st.metric("Remote Options", remote_count)
+        st.metric("Remote Options", stats['remote_count'])
     
     with col4:
-        recent_count = len(internships[internships['days_old'] <= 3])
-        st.metric("Recent (≤3 days)", recent_count)
+        st.metric("Recent (≤3 days)", stats['recent_internships'])
     
     st.markdown("---")
     
     # Stipend distribution chart
     if 'stipend' in internships.columns and len(internships) > 1:
         st.subheader("📊 Stipend Distribution")
-        fig = px.histogram(internships, x='stipend', nbins=20, 
-                          title="Distribution of Stipends",
-                          labels={'stipend': 'Stipend ($)', 'count': 'Number of Internships'})
+        fig = stipend_hist(internships)
         st.plotly_chart(fig, use_container_width=True)
     
     # Location distribution
     if 'location' in internships.columns:
         st.subheader("📍 Location Distribution")
         location_counts = internships['location'].value_counts().head(10)
-        fig = px.pie(values=location_counts.values, names=location_counts.index,
-                    title="Top 10 Locations")
+        # Categorical locations also count categories that were filtered out
+        location_counts = location_counts[location_counts > 0]
+        fig = location_pie(tuple(location_counts.items()))
         st.plotly_chart(fig, use_container_width=True)
     
     st.markdown("---")
@@ -266,29 +358,30 @@ def display_results(internships, name, skills):
     # Individual internship cards
     st.subheader("🎯 Your Personalized Recommendations")
     
-    for idx, internship in internships.iterrows():
-        with st.container():
-            st.markdown(f"""
-            <div class="internship-card">
-                <h3 style="color: #1f77b4; margin-bottom: 0.5rem;">{internship['title']}</h3>
-                <p style="color: #666; margin-bottom: 0.5rem;"><strong>Company:</strong> {internship['company']}</p>
-                <p style="color: #666; margin-bottom: 0.5rem;"><strong>Location:</strong> {internship['location']}</p>
-                <p style="color: #666; margin-bottom: 0.5rem;"><strong>Stipend:</strong> ${internship.get('stipend', 'Not specified')}</p>
-                <p style="color: #666; margin-bottom: 0.5rem;"><strong>Posted:</strong> {internship.get('days_old', 'Unknown')} days ago</p>
-                <p style="color: #666; margin-bottom: 1rem;"><strong>Relevance Score:</strong> {internship.get('relevance_score', 0):.2f}/10</p>
-                <p style="margin-bottom: 1rem;">{str(internship.get('description', 'No description available'))[:200]}...</p>
-                <a href="{internship['apply_url']}" target="_blank" style="background-color: #28a745; color: white; padding: 0.5rem 1rem; text-decoration: none; border-radius: 0.25rem; display: inline-block;">Apply Now</a>
-            </div>
-            """, unsafe_allow_html=True)
+    # Render every card in a single markdown element (fields are escaped, since
+    # stray markup in one card would spill into every card after it)
+    cards_html = "".join(
+        CARD_TPL.format(
+            title=_html_text(row.title),
+            company=_html_text(row.company),
+            location=_html_text(row.location),
+            stipend=_html_text(getattr(row, 'stipend', None), 'Not specified'),
+            days_old=_html_text(getattr(row, 'days_old', None), 'Unknown'),
+            relevance_score=getattr(row, 'relevance_score', 0),
+            description=_html_text(getattr(row, 'description', None), 'No description available', 200),
+            apply_url=_html_text(row.apply_url)
+        )
+        for row in internships.itertuples(index=False)
+    )
+    st.markdown(cards_html, unsafe_allow_html=True)
     
     # Download option
     st.markdown("---")
     st.subheader("📥 Download Results")
     
-    csv = internships.to_csv(index=False)
     st.download_button(
         label="📊 Download as CSV",
-        data=csv,
+        data=df_to_csv_bytes(internships),
         file_name=f"internship_recommendations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv"
     )
@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+import re
+from typing import List, Dict
 import logging
+from frame_utils import lowercase_column
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +23,7 @@ class InternshipFilter:
         }
         
         # Well-known companies for reputation scoring
-        self.prestigious_companies = {
+        self.prestigious_companies = frozenset({
             'google', 'microsoft', 'apple', 'amazon', 'meta', 'facebook',
             'netflix', 'uber', 'airbnb', 'spotify', 'twitter', 'linkedin',
             'salesforce', 'oracle', 'ibm', 'intel', 'nvidia', 'tesla',
@@ -30,7 +31,20 @@ class InternshipFilter:
             'mastercard', 'goldman sachs', 'morgan stanley', 'jpmorgan',
             'mckinsey', 'bain', 'bcg', 'deloitte', 'pwc', 'kpmg',
             'accenture', 'cognizant', 'infosys', 'tcs', 'wipro'
-        }
+        })
+        
+        # Indicators of smaller/startup companies (medium reputation)
+        self.startup_indicators = frozenset({
+            'inc', 'llc', 'corp', 'ltd', 'startup', 'tech', 'software',
+            'limited', 'company', 'co'
+        })
+        
+        # Tokens starting with one of these also count, e.g. 'corporation',
+        # 'incorporated', 'technologies' and compounds like 'techcorp'
+        self._startup_prefixes = ('inc', 'corp', 'tech', 'startup', 'software')
+        
+        # Company names are matched token by token against the sets above
+        self._token_re = re.compile(r'[a-z0-9]+')
     
     def filter_and_rank(self, 
                        internships: pd.DataFrame,
@@ -57,8 +71,8 @@ class InternshipFilter:
         
         logger.info(f"Starting to filter {len(internships)} internships")
         
-        # Create a copy to avoid modifying original data
-        df = internships.copy()
+        # Shallow copy: new score columns never touch the original data
+        df = internships.copy(deep=False)
         
         # Apply filters
         df = self._apply_filters(df, min_stipend, max_days_old)
@@ -70,11 +84,14 @@ class InternshipFilter:
         # Calculate ranking scores
         df = self._calculate_ranking_scores(df, user_skills)
         
-        # Sort by final score
-        df = df.sort_values('final_score', ascending=False)
-        
-        # Return top N results
-        result = df.head(top_n)
+        # Select the top N by final score without sorting the whole frame
+        scores = df['final_score'].to_numpy()
+        if len(scores) > top_n:
+            top_idx = np.argpartition(-scores, top_n)[:top_n]
+            top_idx = top_idx[np.argsort(-scores[top_idx], kind='stable')]
+            result = df.iloc[top_idx]
+        else:
+            result = df.sort_values('final_score', ascending=False)
         
         logger.info(f"Returning {len(result)} top internships")
         return result
@@ -93,26 +110,34 @@ class InternshipFilter:
         """
         original_count = len(df)
         
+        # Build a single boolean mask and slice the frame once at the end
+        mask = np.ones(original_count, dtype=bool)
+        
         # Filter by minimum stipend
         if min_stipend > 0:
-            df = df[df['stipend'] >= min_stipend]
-            logger.info(f"After stipend filter: {len(df)} internships (removed {original_count - len(df)})")
+            mask &= df['stipend'].fillna(0).to_numpy() >= min_stipend
+            remaining = np.count_nonzero(mask)
+            logger.info(f"After stipend filter: {remaining} internships (removed {original_count - remaining})")
         
         # Filter by maximum age (but keep unknown ages)
         if max_days_old < 999:  # 999 is our "unknown age" value
             # Keep internships with unknown age (999) and those within the age limit
-            df = df[(df['days_old'] <= max_days_old) | (df['days_old'] == 999)]
-            logger.info(f"After age filter: {len(df)} internships (removed {original_count - len(df)})")
+            days_old = df['days_old'].to_numpy(np.float64, na_value=np.nan)
+            mask &= (days_old <= max_days_old) | (days_old == 999)
+            remaining = np.count_nonzero(mask)
+            logger.info(f"After age filter: {remaining} internships (removed {original_count - remaining})")
         
         # Remove internships with missing critical information
-        df = df.dropna(subset=['title', 'company', 'apply_url'])
+        mask &= df['title'].notna().to_numpy() & df['company'].notna().to_numpy()
         
-        # Remove internships with empty apply URLs
-        df = df[df['apply_url'].astype(str).str.strip() != '']
+        # Remove internships with missing or empty apply URLs
+        mask &= (df['apply_url'].fillna('').str.strip() != '').to_numpy()
         
         # Remove internships with very low relevance scores (handle NaN values)
         # Lowered threshold to 0.1 to keep more internships
-        df = df[df['relevance_score'].fillna(0) >= 0.1]
+        mask &= df['relevance_score'].fillna(0).to_numpy() >= 0.1
+        
+        df = df.loc[mask]
         
         logger.info(f"Final filtered count: {len(df)} internships")
         return df
@@ -128,37 +153,37 @@ class InternshipFilter:
         Returns:
             pd.DataFrame: Data with ranking scores
         """
-        # Normalize relevance score (0-10 scale) - handle NaN values
-        df['relevance_normalized'] = df['relevance_score'].fillna(0) / 10.0
+        # Pull each input column out once as a float32 array
+        relevance = df['relevance_score'].fillna(0).to_numpy(np.float32)
+        stipend = df['stipend'].fillna(0).to_numpy(np.float32)
+        recency = self._calculate_recency_score(df['days_old'])
+        reputation = self._calculate_company_reputation(lowercase_column(df, 'company'))
+        
+        # Stipend is normalized against the best-paying internship in the set
+        max_stipend = stipend.max()
+        stipend_normalized = np.clip(stipend / max_stipend, 0, 1) if max_stipend > 0 else 0
+        
+        # Calculate final weighted score in a single pass (relevance is on a 0-10 scale)
+        final_score = (
+            relevance * (self.weights['relevance_score'] / 10.0) +
+            stipend_normalized * self.weights['stipend'] +
+            recency * self.weights['recency'] +
+            reputation * self.weights['company_reputation']
+        )
         
-        # Normalize stipend (0-1 scale, assuming max $5000/month) - handle NaN values
+        # Keep the filled stipend and each normalized component alongside the final score
         df['stipend'] = df['stipend'].fillna(0)
-        max_stipend = df['stipend'].max()
-        if max_stipend > 0:
-            df['stipend_normalized'] = np.clip(df['stipend'] / max_stipend, 0, 1)
-        else:
-            df['stipend_normalized'] = 0
-        
-        # Calculate recency score (newer is better)
-        df['recency_normalized'] = self._calculate_recency_score(df['days_old'])
-        
-        # Calculate company reputation score
-        df['company_reputation_normalized'] = df['company'].apply(self._calculate_company_reputation)
-        
-        # Calculate final weighted score
-        df['final_score'] = (
-            df['relevance_normalized'] * self.weights['relevance_score'] +
-            df['stipend_normalized'] * self.weights['stipend'] +
-            df['recency_normalized'] * self.weights['recency'] +
-            df['company_reputation_normalized'] * self.weights['company_reputation']
-        )
+        df['relevance_normalized'] = relevance / 10.0
+        df['stipend_normalized'] = stipend_normalized
+        df['recency_normalized'] = recency
+        df['company_reputation_normalized'] = reputation
         
         # Round final score to 2 decimal places
-        df['final_score'] = df['final_score'].round(2)
+        df['final_score'] = np.round(final_score, 2)
         
         return df
     
-    def _calculate_recency_score(self, days_old_series: pd.Series) -> pd.Series:
+    def _calculate_recency_score(self, days_old_series: pd.Series) -> np.ndarray:
         """
         Calculate recency score (newer jobs get higher scores).
         
@@ -166,49 +191,63 @@ class InternshipFilter:
             days_old_series (pd.Series): Series of days old values
             
         Returns:
-            pd.Series: Normalized recency scores
+            np.ndarray: Normalized recency scores
         """
-        # Handle NaN values and unknown ages (999)
-        days_old_series = days_old_series.fillna(999)  # Fill NaN with 999
-        days_old_series = days_old_series.replace(999, 30)  # Treat unknown as 30 days old
+        days_old = days_old_series.to_numpy(np.float32, na_value=np.nan)
+        
+        # Treat NaN and unknown ages (999) as 30 days old
+        days_old = np.where(np.isnan(days_old) | (days_old == 999), 30.0, days_old)
         
-        # Calculate score: newer jobs get higher scores
         # Score = 1 for 0 days old, decreases linearly to 0 for 30+ days old
-        recency_scores = np.clip(1 - (days_old_series / 30), 0, 1)
+        return np.clip(1.0 - days_old * (1.0 / 30.0), 0.0, 1.0)
+    
+    def _calculate_company_reputation(self, company: pd.Series) -> np.ndarray:
+        """
+        Calculate company reputation scores.
         
-        return recency_scores
+        Args:
+            company (pd.Series): Series of lowercased company names
+            
+        Returns:
+            np.ndarray: Reputation scores (0-1)
+        """
+        return np.fromiter(
+            (self._score_company(name) for name in company),
+            dtype=np.float32,
+            count=len(company)
+        )
     
-    def _calculate_company_reputation(self, company_name) -> float:
+    def _score_company(self, company_name: str) -> float:
         """
-        Calculate company reputation score.
+        Score a single lowercased company name by set lookups on its tokens.
         
         Args:
-            company_name: Company name (str or any type)
+            company_name (str): Lowercased company name
             
         Returns:
             float: Reputation score (0-1)
         """
-        # Handle NaN, None, or non-string values
-        if pd.isna(company_name) or company_name is None:
-            return 0.0
+        tokens = self._token_re.findall(company_name)
         
-        # Convert to string and handle any type
-        try:
-            company_str = str(company_name).lower().strip()
-        except:
+        # Missing or empty company names
+        if not tokens:
             return 0.0
         
-        if not company_str:
-            return 0.0
+        # The scraper's placeholder for missing names scores like any unknown company
+        if company_name == 'unknown company':
+            return 0.3
+        
+        # Adjacent token pairs also match multi-word names like "goldman sachs"
+        candidates = set(tokens)
+        candidates.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
         
         # Check if it's a prestigious company
-        for prestigious_company in self.prestigious_companies:
-            if prestigious_company in company_str:
-                return 1.0
+        if not candidates.isdisjoint(self.prestigious_companies):
+            return 1.0
         
         # Check for startup indicators (medium reputation)
-        startup_indicators = ['inc', 'llc', 'corp', 'ltd', 'startup', 'tech', 'software']
-        if any(indicator in company_str for indicator in startup_indicators):
+        if not candidates.isdisjoint(self.startup_indicators) or any(
+                token.startswith(self._startup_prefixes) for token in tokens):
             return 0.5
         
         # Default score for unknown companies
@@ -257,16 +296,23 @@ class InternshipFilter:
         if internships.empty:
             return {}
         
+        # Numeric aggregates in a single agg call
+        aggregates = internships.agg({
+            'stipend': ['mean', 'max', 'min'],
+            'relevance_score': 'mean',
+            'days_old': 'mean'
+        })
+        
         stats = {
             'total_internships': len(internships),
-            'avg_stipend': internships['stipend'].mean(),
-            'max_stipend': internships['stipend'].max(),
-            'min_stipend': internships['stipend'].min(),
-            'avg_relevance_score': internships['relevance_score'].mean(),
-            'avg_days_old': internships['days_old'].mean(),
-            'remote_count': len(internships[internships['location'].str.contains('Remote', case=False, na=False)]),
-            'prestigious_companies': len(internships[internships['company_reputation_normalized'] >= 0.8]),
-            'recent_internships': len(internships[internships['days_old'] <= 3])
+            'avg_stipend': aggregates.at['mean', 'stipend'],
+            'max_stipend': aggregates.at['max', 'stipend'],
+            'min_stipend': aggregates.at['min', 'stipend'],
+            'avg_relevance_score': aggregates.at['mean', 'relevance_score'],
+            'avg_days_old': aggregates.at['mean', 'days_old'],
+            'remote_count': int(lowercase_column(internships, 'location').str.contains('remote', regex=False, na=False).sum()),
+            'prestigious_companies': int((internships['company_reputation_normalized'] >= 0.8).sum()),
+            'recent_internships': int((internships['days_old'] <= 3).sum())
         }
         
         return stats
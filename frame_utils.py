@@ -0,0 +1,58 @@
+import pandas as pd
+from typing import List
+
+# Copy-on-Write is process-wide, so it is switched on here once for every module that
+# imports these helpers: shallow copies share column data until they are modified and
+# column assignments make no defensive copies (always on from pandas 3.0, where the
+# option is deprecated)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Precomputed lowercase copies of text columns are stored as "<column>_lc"
+LOWERCASE_SUFFIX = '_lc'
+
+def lowercase_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Get the lowercase text of a column, reusing its "<column>_lc" copy if present.
+    
+    Args:
+        df (pd.DataFrame): Job data
+        column (str): Text column name
+    
+    Returns:
+        pd.Series: Lowercase text ('' where missing)
+    """
+    lowercase_name = column + LOWERCASE_SUFFIX
+    if lowercase_name in df.columns:
+        return df[lowercase_name]
+    
+    values = df[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Categoricals can't be filled with a new value, so go back to plain strings
+        values = values.astype(values.cat.categories.dtype)
+    return values.fillna('').str.lower()
+
+def add_lowercase_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Add a lowercase "<column>_lc" copy of each column for later lowercase_column calls.
+    
+    Args:
+        df (pd.DataFrame): Job data
+        columns (List[str]): Text column names
+    
+    Returns:
+        pd.DataFrame: Job data with the lowercase columns added
+    """
+    return df.assign(**{column + LOWERCASE_SUFFIX: lowercase_column(df, column) for column in columns})
+
+def drop_lowercase_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop the precomputed lowercase columns (they are internal helpers, not data).
+    
+    Args:
+        df (pd.DataFrame): Job data
+    
+    Returns:
+        pd.DataFrame: Job data without "<column>_lc" columns
+    """
+    return df.drop(columns=[column for column in df.columns if column.endswith(LOWERCASE_SUFFIX)])
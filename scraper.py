@@ -1,7 +1,17 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import requests
 from jobspy import scrape_jobs
+from frame_utils import add_lowercase_columns, lowercase_column
+import asyncio
+import functools
+import hashlib
+import os
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
 import re
 from typing import List, Dict, Optional
 import logging
@@ -10,6 +20,117 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regex patterns are plain strings: they are applied through pandas .str methods,
+# which run them in Arrow's regex engine on pyarrow-backed columns (where compiled
+# Python patterns are not accepted, and extract needs a named group)
+
+# Salary amounts like 1,000 or 1000.00
+_AMOUNT = r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?'
+
+# Salary pattern in priority order: the first $ amount, else the first hourly rate, else
+# the first monthly rate. Anchoring at the start makes the alternation pick the first
+# kind that occurs anywhere in the text, rather than whichever kind occurs first.
+_SALARY_PATTERN = (
+    r'(?s)^(?:'
+    rf'.*?\$(?P<dollar>{_AMOUNT})'
+    rf'|.*?(?P<hourly>{_AMOUNT})\s*(?:per\s+)?(?:hour|hr|/h)'
+    rf'|.*?(?P<monthly>{_AMOUNT})\s*(?:per\s+)?(?:month|mo)'
+    r')'
+)
+
+# Pay period hints in a job description
+_HOURLY_PATTERN = r'hour|hr|/h'
+_MONTHLY_PATTERN = r'month|mo'
+
+# jobspy columns used downstream (everything else is dropped right after scraping)
+_SCRAPED_COLUMNS = ['title', 'company', 'location', 'description', 'job_url', 'date_posted']
+
+# jobspy text columns (kept as strings even when a batch has no values for them)
+_TEXT_COLUMNS = ['title', 'company', 'location', 'description', 'job_url']
+
+# On-disk cache of raw jobspy results
+_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'internship_scraper_cache')
+
+# Network errors worth retrying (anything else is logged and skipped)
+TRANSIENT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout
+)
+
+# Request spacing per job board in seconds: (starting interval, fastest, slowest).
+# LinkedIn starts blocking well before Indeed does, so it is never pushed as hard.
+SITE_INTERVALS = {
+    'linkedin': (2.0, 1.0, 60.0),
+    'indeed': (2.0, 0.5, 60.0)
+}
+
+class RateLimiter:
+    """
+    A thread-safe limiter that spaces out request start times by a fixed interval.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """Block until the caller is allowed to issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        
+        if delay > 0:
+            time.sleep(delay)
+
+class AdaptiveLimiter(RateLimiter):
+    """
+    A rate limiter that speeds up while a site keeps answering and backs off when it pushes back.
+    
+    The interval is halved after a streak of successful requests and doubled on every
+    transient error, always staying between min_interval and max_interval.
+    """
+    
+    def __init__(self, interval: float, min_interval: float, max_interval: float, success_streak: int = 3):
+        super().__init__(interval)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.success_streak = success_streak
+        self._successes = 0
+    
+    def record_success(self):
+        """Shorten the interval after enough consecutive successful requests."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.success_streak:
+                self.interval = max(self.min_interval, self.interval / 2)
+                self._successes = 0
+    
+    def record_failure(self):
+        """Double the interval after a failed request."""
+        with self._lock:
+            self._successes = 0
+            self.interval = min(self.max_interval, self.interval * 2)
+            
+            # Hold every request to this site until the next slot
+            self._next_time = max(self._next_time, time.monotonic() + self.interval)
+
+@functools.lru_cache(maxsize=32)
+def _skill_pattern(user_skills: tuple) -> str:
+    """
+    Get a regex matching any of the user's skills, built once per skill set.
+    
+    Args:
+        user_skills (tuple): User skills (a tuple, so the skill set can key the cache)
+        
+    Returns:
+        str: Alternation of the escaped lowercase skills
+    """
+    return '|'.join(re.escape(skill.lower()) for skill in user_skills)
+
 class InternshipScraper:
     """
     A class to scrape internship data from various job boards using the jobspy library.
@@ -21,6 +142,19 @@ class InternshipScraper:
             'intern', 'internship', 'co-op', 'coop', 'trainee', 'apprentice',
             'entry level', 'junior', 'graduate', 'student', 'summer intern'
         ]
+        self.senior_keywords = ['senior', 'lead', 'principal', 'manager', 'director']
+        
+        # Single-pass matchers for all keywords at once
+        self._intern_pattern = '|'.join(map(re.escape, self.internship_keywords))
+        self._senior_pattern = '|'.join(map(re.escape, self.senior_keywords))
+        self.hours_old = 168  # Only fetch postings from the last 7 days
+        self.cache_dir = _CACHE_DIR
+        self.cache_ttl = 6 * 3600  # Reuse cached results for 6 hours
+        self.max_concurrency_per_site = 2  # In-flight requests per job board
+        self.max_retries = 3  # Retries on transient network errors
+        
+        # Separate limiter per job board, adapting to how hard each one pushes back
+        self.rate_limiters = {site: AdaptiveLimiter(*SITE_INTERVALS[site]) for site in self.sites}
     
     def scrape_internships(self, 
                           skills: List[str], 
@@ -39,53 +173,221 @@ class InternshipScraper:
         """
         logger.info(f"Starting to scrape internships for skills: {skills}")
         
-        all_internships = []
+        # Drop expired cache files so the cache directory doesn't grow forever
+        self._purge_cache()
         
         # Create search terms combining skills with internship keywords
         search_terms = self._create_search_terms(skills)
         
-        for search_term in search_terms:
-            logger.info(f"Searching for: {search_term}")
+        results_wanted = min(max_results // len(search_terms), 50)
+        
+        # Scrape all search terms concurrently
+        results = asyncio.run(self._scrape_all(search_terms, location, results_wanted))
+        
+        frames: List[pd.DataFrame] = []
+        for search_term, jobs in zip(search_terms, results):
+            if jobs is None or jobs.empty:
+                continue
+            
+            # Arrow-backed columns keep the keyword matching in Arrow's string kernels
+            jobs = jobs.convert_dtypes(dtype_backend='pyarrow')
+            # A column jobspy left entirely empty comes back as null[pyarrow]; keep text columns as strings
+            jobs = jobs.astype({column: pd.ArrowDtype(pa.string()) for column in _TEXT_COLUMNS if column in jobs.columns})
+            
+            # Filter for internships before combining, so only internships are concatenated
+            internship_jobs = self._filter_internships(jobs)
+            logger.info(f"Found {len(internship_jobs)} internships for '{search_term}'")
+            if not internship_jobs.empty:
+                frames.append(internship_jobs)
+        
+        if not frames:
+            logger.warning("No internships found")
+            return pd.DataFrame()
+        
+        # Combine all search terms in a single concat
+        df = pd.concat(frames, ignore_index=True)
+        
+        # Clean data (this also removes duplicate postings)
+        df = self._clean_and_enhance_data(df, skills)
+        
+        logger.info(f"Total unique internships found: {len(df)}")
+        return df
+    
+    async def _scrape_all(self,
+                          search_terms: List[str],
+                          location: str,
+                          results_wanted: int) -> List[Optional[pd.DataFrame]]:
+        """
+        Scrape every search term on every site concurrently.
+        
+        Args:
+            search_terms (List[str]): Search terms to scrape
+            location (str): Preferred location
+            results_wanted (int): Number of results to request per search term and site
+            
+        Returns:
+            List[Optional[pd.DataFrame]]: Scraped jobs per search term (None if nothing was found)
+        """
+        semaphores = {site: asyncio.Semaphore(self.max_concurrency_per_site) for site in self.sites}
+        
+        async def scrape_site(search_term: str, site: str) -> Optional[pd.DataFrame]:
+            async with semaphores[site]:
+                # jobspy is blocking, so each call runs in a worker thread
+                return await asyncio.to_thread(self._scrape_site, search_term, site, location, results_wanted)
+        
+        # One task per (search term, site) pair, gathered in order
+        results = await asyncio.gather(*(
+            scrape_site(search_term, site) for search_term in search_terms for site in self.sites
+        ))
+        
+        # Combine the per-site results of each search term
+        jobs_per_term = []
+        for i in range(len(search_terms)):
+            site_results = results[i * len(self.sites):(i + 1) * len(self.sites)]
+            frames = [jobs for jobs in site_results if jobs is not None and not jobs.empty]
+            jobs_per_term.append(pd.concat(frames, ignore_index=True) if frames else None)
+        
+        return jobs_per_term
+    
+    def _scrape_site(self,
+                     search_term: str,
+                     site: str,
+                     location: str,
+                     results_wanted: int) -> Optional[pd.DataFrame]:
+        """
+        Scrape jobs for a single search term on a single site, retrying transient errors.
+        
+        Args:
+            search_term (str): Search term
+            site (str): Job board to scrape
+            location (str): Preferred location
+            results_wanted (int): Number of results to request
+            
+        Returns:
+            Optional[pd.DataFrame]: Scraped jobs, or None if scraping failed or found nothing
+        """
+        cache_path = self._cache_path(site, search_term, location, results_wanted)
+        cached_jobs = self._read_cache(cache_path)
+        if cached_jobs is not None:
+            logger.info(f"Using cached {site} results for: {search_term}")
+            return cached_jobs
+        
+        limiter = self.rate_limiters[site]
+        for attempt in range(self.max_retries + 1):
+            limiter.wait()
+            logger.info(f"Searching {site} for: {search_term}")
             
             try:
                 # Scrape jobs using jobspy
                 jobs = scrape_jobs(
-                    site_name=self.sites,
+                    site_name=[site],
                     search_term=search_term,
                     location=location,
-                    results_wanted=min(max_results // len(search_terms), 50),
-                    hours_old=168,  # Last 7 days
+                    results_wanted=results_wanted,
+                    hours_old=self.hours_old,
                     country_indeed='usa'  # Focus on US market
                 )
+            except TRANSIENT_ERRORS as e:
+                # jobspy catches its own network errors, so this only guards against ones a
+                # future version lets through. Slow this site down; the next wait() holds
+                # the retry back accordingly
+                limiter.record_failure()
+                if attempt == self.max_retries:
+                    logger.error(f"Giving up on {site} for '{search_term}': {str(e)}")
+                    return None
                 
-                if jobs is not None and not jobs.empty:
-                    # Convert DataFrame to list of dictionaries
-                    jobs_list = jobs.to_dict('records')
-                    # Filter for internships
-                    internship_jobs = self._filter_internships(jobs_list)
-                    all_internships.extend(internship_jobs)
-                    logger.info(f"Found {len(internship_jobs)} internships for '{search_term}'")
-                
-                # Add delay to avoid rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error scraping for '{search_term}': {str(e)}")
+                logger.warning(f"Transient error on {site} for '{search_term}', retrying at one request every {limiter.interval:.0f}s: {str(e)}")
                 continue
+            except Exception as e:
+                logger.error(f"Error scraping {site} for '{search_term}': {str(e)}")
+                return None
+            
+            # jobspy logs blocks and connection errors itself and returns no rows instead of
+            # raising. No rows may also just mean nothing matched, so an empty result is
+            # neither retried nor counted for or against the site
+            if jobs is None or jobs.empty:
+                logger.info(f"No results from {site} for '{search_term}'")
+                return None
+            
+            limiter.record_success()
+            
+            # Keep only the columns used downstream (only non-empty results are ever cached)
+            jobs = jobs[[column for column in _SCRAPED_COLUMNS if column in jobs.columns]]
+            self._write_cache(cache_path, jobs)
+            return jobs
+    
+    def _cache_path(self, site: str, search_term: str, location: str, results_wanted: int) -> str:
+        """
+        Get the cache file path for a single scrape request.
         
-        if not all_internships:
-            logger.warning("No internships found")
-            return pd.DataFrame()
-        
-        # Convert to DataFrame and clean data
-        df = pd.DataFrame(all_internships)
-        df = self._clean_and_enhance_data(df, skills)
+        Args:
+            site (str): Job board
+            search_term (str): Search term
+            location (str): Preferred location
+            results_wanted (int): Number of results requested
+            
+        Returns:
+            str: Path of the parquet cache file
+        """
+        key = repr((site, search_term, location, self.hours_old, results_wanted))
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.parquet')
+    
+    def _read_cache(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Read cached jobs if the cache file exists and has not expired.
         
-        # Remove duplicates
-        df = df.drop_duplicates(subset=['title', 'company', 'location'], keep='first')
+        Args:
+            path (str): Path of the parquet cache file
+            
+        Returns:
+            Optional[pd.DataFrame]: Cached jobs, or None on a cache miss
+        """
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read scrape cache {path}: {str(e)}")
+            return None
+    
+    def _write_cache(self, path: str, jobs: pd.DataFrame):
+        """
+        Write scraped jobs to the cache (failures are logged and ignored).
         
-        logger.info(f"Total unique internships found: {len(df)}")
-        return df
+        Args:
+            path (str): Path of the parquet cache file
+            jobs (pd.DataFrame): Scraped jobs
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            jobs.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write scrape cache {path}: {str(e)}")
+    
+    def _purge_cache(self):
+        """Delete cache files older than the cache TTL (failures are logged and ignored)."""
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Could not list scrape cache {self.cache_dir}: {str(e)}")
+            return
+        
+        now = time.time()
+        for entry in entries:
+            try:
+                if now - entry.stat().st_mtime > self.cache_ttl:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue  # Already removed by another scrape
+            except OSError as e:
+                logger.warning(f"Could not remove expired scrape cache {entry.path}: {str(e)}")
     
     def _create_search_terms(self, skills: List[str]) -> List[str]:
         """
@@ -111,35 +413,31 @@ class InternshipScraper:
         
         return search_terms[:8]  # Limit total search terms
     
-    def _filter_internships(self, jobs: List[Dict]) -> List[Dict]:
+    def _filter_internships(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filter jobs to keep only internships.
         
         Args:
-            jobs (List[Dict]): List of job dictionaries
+            df (pd.DataFrame): Scraped job data
             
         Returns:
-            List[Dict]: Filtered list of internship jobs
+            pd.DataFrame: Internship jobs only
         """
-        internships = []
+        # Lowercase text is kept as "_lc" columns, so later passes don't lowercase it again
+        df = add_lowercase_columns(df, ['title'])
         
-        for job in jobs:
-            # Handle None and NaN values properly
-            title = str(job.get('title', '') or '').lower()
-            description = str(job.get('description', '') or '').lower()
-            
-            # Check if it's an internship
-            is_internship = any(keyword in title or keyword in description 
-                              for keyword in self.internship_keywords)
-            
-            # Exclude senior/lead positions
-            is_not_senior = not any(senior_word in title 
-                                  for senior_word in ['senior', 'lead', 'principal', 'manager', 'director'])
-            
-            if is_internship and is_not_senior:
-                internships.append(job)
+        # Exclude senior/lead positions first, without touching their descriptions
+        is_not_senior = ~lowercase_column(df, 'title').str.contains(self._senior_pattern).to_numpy(dtype=bool)
+        df = add_lowercase_columns(df.loc[is_not_senior], ['description'])
+        title = lowercase_column(df, 'title')
+        description = lowercase_column(df, 'description')
         
-        return internships
+        # Check if it's an internship, scanning descriptions only where the title doesn't say so
+        is_internship = title.str.contains(self._intern_pattern).to_numpy(dtype=bool, copy=True)
+        undecided = ~is_internship
+        is_internship[undecided] = description[undecided].str.contains(self._intern_pattern).to_numpy(dtype=bool)
+        
+        return df.loc[is_internship]
     
     def _clean_and_enhance_data(self, df: pd.DataFrame, user_skills: List[str]) -> pd.DataFrame:
         """
@@ -155,28 +453,28 @@ class InternshipScraper:
         if df.empty:
             return df
         
-        # Clean company names
-        df['company'] = df['company'].fillna('Unknown Company')
-        df['company'] = df['company'].str.strip()
+        # Clean company names, job titles and locations in one pass
+        df = df.assign(
+            company=df['company'].str.strip().fillna('Unknown Company'),
+            title=df['title'].str.strip().fillna('Unknown Title'),
+            location=df['location'].str.strip().fillna('Not specified')
+        )
         
-        # Clean job titles
-        df['title'] = df['title'].fillna('Unknown Title')
-        df['title'] = df['title'].str.strip()
+        # Remove duplicates (search terms overlap heavily) before the expensive passes
+        df = df.drop_duplicates(subset=['title', 'company', 'location'], keep='first')
         
-        # Clean locations
-        df['location'] = df['location'].fillna('Not specified')
-        df['location'] = df['location'].str.strip()
+        # Lowercase text shared by the stipend and relevance passes
+        title_lc = lowercase_column(df, 'title')
+        description_lc = lowercase_column(df, 'description')
         
         # Extract and clean stipend/salary information
-        df['stipend'] = df.apply(self._extract_stipend, axis=1)
+        df['stipend'] = self._extract_stipend(title_lc, description_lc)
         
         # Calculate days old
-        df['days_old'] = df.apply(self._calculate_days_old, axis=1)
+        df['days_old'] = self._calculate_days_old(df)
         
         # Calculate relevance score based on user skills
-        df['relevance_score'] = df.apply(
-            lambda row: self._calculate_relevance_score(row, user_skills), axis=1
-        )
+        df['relevance_score'] = self._calculate_relevance_score(df, title_lc, description_lc, user_skills)
         
         # Clean apply URLs
         df['apply_url'] = df['job_url'].fillna('')
@@ -195,119 +493,120 @@ class InternshipScraper:
         
         df = df[list(columns_mapping.keys())].rename(columns=columns_mapping)
         
+        # Shrink memory: repetitive strings become categories, numbers are downcast
+        # (relevance scores already come back as float32)
+        # (measuring memory walks every string, so it only happens when debugging)
+        log_memory = logger.isEnabledFor(logging.DEBUG)
+        if log_memory:
+            memory_before = df.memory_usage(deep=True).sum() / 1e6
+        df['company'] = df['company'].astype('category')
+        df['location'] = df['location'].astype('category')
+        df['days_old'] = pd.to_numeric(df['days_old'], downcast='integer')
+        df['stipend'] = pd.to_numeric(df['stipend'], downcast='float')
+        if log_memory:
+            memory_after = df.memory_usage(deep=True).sum() / 1e6
+            logger.debug(f"Memory usage: {memory_before:.2f} MB -> {memory_after:.2f} MB")
+        
         return df
     
-    def _extract_stipend(self, row) -> float:
+    def _extract_stipend(self, title: pd.Series, description: pd.Series) -> pd.Series:
         """
-        Extract stipend/salary information from job description.
+        Extract stipend/salary information from job descriptions.
         
         Args:
-            row: DataFrame row containing job information
+            title (pd.Series): Lowercase job titles
+            description (pd.Series): Lowercase job descriptions
             
         Returns:
-            float: Extracted stipend amount
+            pd.Series: Extracted monthly stipend amounts (0 if none found)
         """
-        description = str(row.get('description', '')).lower()
-        title = str(row.get('title', '')).lower()
-        
-        # Look for salary patterns
-        salary_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # $1,000.00 or $1000
-            r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+)?(?:hour|hr|/h)',  # hourly rates
-            r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+)?(?:month|mo)',  # monthly rates
-        ]
+        text = description + ' ' + title
+        
+        # Look for salary patterns in a single regex pass; at most one group matches per job
+        matches = text.str.extract(_SALARY_PATTERN)
+        
+        # Unmatched groups come back empty or missing depending on the string backend
+        amount = matches['dollar'].fillna('') + matches['hourly'].fillna('') + matches['monthly'].fillna('')
+        amount = pd.to_numeric(amount.str.replace(',', '', regex=False), errors='coerce').astype(float)
+        
+        # Convert hourly to monthly (assuming 160 hours/month)
+        hourly_factor = np.where(description.str.contains(_HOURLY_PATTERN), 160, 1)
+        
+        # Convert monthly to yearly (assuming 12 months)
+        monthly_factor = np.where(description.str.contains(_MONTHLY_PATTERN), 12, 1)
         
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, description + ' ' + title)
-            if matches:
-                try:
-                    # Take the first match and convert to float
-                    amount_str = matches[0].replace(',', '')
-                    amount = float(amount_str)
-                    
-                    # Convert hourly to monthly (assuming 160 hours/month)
-                    if 'hour' in description or 'hr' in description or '/h' in description:
-                        amount = amount * 160
-                    
-                    # Convert monthly to yearly (assuming 12 months)
-                    if 'month' in description or 'mo' in description:
-                        amount = amount * 12
-                    
-                    # Return monthly equivalent
-                    return amount / 12
-                    
-                except ValueError:
-                    continue
-        
-        return 0.0  # No stipend found
+        # Return monthly equivalent
+        return (amount * hourly_factor * monthly_factor / 12).fillna(0.0)
     
-    def _calculate_days_old(self, row) -> int:
+    def _calculate_days_old(self, df: pd.DataFrame) -> pd.Series:
         """
-        Calculate how many days old the job posting is.
+        Calculate how many days old each job posting is.
         
         Args:
-            row: DataFrame row containing job information
+            df (pd.DataFrame): Job data
             
         Returns:
-            int: Number of days old
+            pd.Series: Number of days old (999 if unknown)
         """
-        date_posted = row.get('date_posted')
+        # One vectorized parse; cache=True parses each distinct date only once
+        date_posted = pd.to_datetime(df['date_posted'], errors='coerce', cache=True)
+        days_old = (pd.Timestamp.now() - date_posted).dt.days
         
-        if pd.isna(date_posted) or date_posted is None:
-            return 999  # Unknown age
-        
-        try:
-            if isinstance(date_posted, str):
-                # Try to parse the date string
-                date_posted = pd.to_datetime(date_posted)
-            
-            days_old = (datetime.now() - date_posted).days
-            return max(0, days_old)
-            
-        except Exception:
-            return 999  # Unknown age
+        return days_old.clip(lower=0).fillna(999).astype('int32')
     
-    def _calculate_relevance_score(self, row: pd.Series, user_skills: List[str]) -> float:
+    def _calculate_relevance_score(self,
+                                   df: pd.DataFrame,
+                                   title: pd.Series,
+                                   description: pd.Series,
+                                   user_skills: List[str]) -> pd.Series:
         """
-        Calculate relevance score based on user skills.
+        Calculate relevance scores based on user skills.
         
         Args:
-            row: DataFrame row containing job information
+            df (pd.DataFrame): Job data
+            title (pd.Series): Lowercase job titles
+            description (pd.Series): Lowercase job descriptions
             user_skills: List of user skills
             
         Returns:
-            float: Relevance score (0-10)
+            pd.Series: Relevance scores (0-10)
         """
-        title = str(row.get('title', '')).lower()
-        description = str(row.get('description', '')).lower()
-        company = str(row.get('company', '')).lower()
+        company = lowercase_column(df, 'company')
+        
+        # Match directly on Arrow arrays so every check is a single C++ kernel call
+        title = pa.array(title, type=pa.string())
+        text = pc.binary_join_element_wise(
+            title,
+            pa.array(description, type=pa.string()),
+            pa.array(company, type=pa.string()),
+            ' '
+        )
         
-        text = f"{title} {description} {company}"
+        # Only jobs mentioning at least one skill need the per-skill checks
+        has_skill = pc.match_substring_regex(text, _skill_pattern(tuple(user_skills))).to_numpy(zero_copy_only=False)
+        matched_text = text.filter(has_skill)
+        matched_title = title.filter(has_skill)
         
-        # Count skill matches
-        skill_matches = 0
+        skill_matches = np.zeros(len(df))
+        title_bonus = np.zeros(len(df))
         for skill in user_skills:
             skill_lower = skill.lower()
-            if skill_lower in text:
-                skill_matches += 1
+            # Count skill matches
+            skill_matches[has_skill] += pc.match_substring(matched_text, skill_lower).to_numpy(zero_copy_only=False)
+            # Bonus for exact skill matches in title
+            title_bonus[has_skill] += pc.match_substring(matched_title, skill_lower).to_numpy(zero_copy_only=False)
         
         # Calculate base score
         base_score = (skill_matches / len(user_skills)) * 10
         
-        # Bonus for exact skill matches in title
-        title_bonus = 0
-        for skill in user_skills:
-            if skill.lower() in title:
-                title_bonus += 1
-        
         # Bonus for internship keywords in title
-        internship_bonus = 0
+        internship_bonus = np.zeros(len(df))
         for keyword in self.internship_keywords:
-            if keyword in title:
-                internship_bonus += 0.5
+            internship_bonus += pc.match_substring(title, keyword).to_numpy(zero_copy_only=False) * 0.5
         
-        final_score = min(10.0, base_score + title_bonus + internship_bonus)
-        return round(final_score, 2)
+        # Cap, round and downcast the total in one vectorized expression
+        final_score = np.round(np.minimum(10.0, base_score + title_bonus + internship_bonus), 2).astype('float32')
+        return pd.Series(final_score, index=df.index)
 
 # Example usage and testing
 if __name__ == "__main__":
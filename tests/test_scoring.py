@@ -0,0 +1,197 @@
+"""
+Pin the vectorized scoring in scraper.py and filter.py to the original per-row logic.
+
+The reference functions below are the per-row implementations the vectorized code
+replaced, kept here so any change in their results shows up as a test failure.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from filter import InternshipFilter
+from scraper import InternshipScraper
+
+SKILLS = ['Python', 'C++', 'Node.js', 'Machine Learning']
+
+JOBS = pd.DataFrame({
+    'title': [
+        'Python Intern',
+        'C++ Developer Internship',
+        'Node.js Co-op',
+        'Data Analyst',
+        'Machine Learning Trainee',
+        'Marketing Intern'
+    ],
+    'company': ['Google', 'Acme Inc', 'Random Labs', 'Bank Co', 'Dell Technologies', 'Shop'],
+    'description': [
+        'Pay: $3,500 per month. Work with Python and SQL.',
+        'Earn 25 per hour writing C++ code.',
+        'Stipend of 2,000 per month for NodeXjs and node.js work.',
+        'No pay listed; cpp and nodejs are a plus.',
+        'We offer $20.50/h for machine learning research.',
+        'Unpaid role, 12 week program.'
+    ]
+})
+
+def reference_stipend(title: str, description: str) -> float:
+    """Per-row stipend extraction the vectorized version replaced."""
+    description = str(description).lower()
+    title = str(title).lower()
+    salary_patterns = [
+        r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
+        r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+)?(?:hour|hr|/h)',
+        r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+)?(?:month|mo)',
+    ]
+    for pattern in salary_patterns:
+        matches = re.findall(pattern, description + ' ' + title)
+        if matches:
+            amount = float(matches[0].replace(',', ''))
+            if 'hour' in description or 'hr' in description or '/h' in description:
+                amount = amount * 160
+            if 'month' in description or 'mo' in description:
+                amount = amount * 12
+            return amount / 12
+    return 0.0
+
+def reference_days_old(date_posted) -> int:
+    """Per-row posting age the vectorized version replaced."""
+    if pd.isna(date_posted) or date_posted is None:
+        return 999
+    try:
+        if isinstance(date_posted, str):
+            date_posted = pd.to_datetime(date_posted)
+        return max(0, (datetime.now() - date_posted).days)
+    except Exception:
+        return 999
+
+def reference_relevance(title: str, description: str, company: str,
+                        user_skills: List[str], internship_keywords: List[str]) -> float:
+    """Per-row relevance score the vectorized version replaced."""
+    title = str(title).lower()
+    text = f"{title} {str(description).lower()} {str(company).lower()}"
+    skill_matches = sum(1 for skill in user_skills if skill.lower() in text)
+    base_score = (skill_matches / len(user_skills)) * 10
+    title_bonus = sum(1 for skill in user_skills if skill.lower() in title)
+    internship_bonus = sum(0.5 for keyword in internship_keywords if keyword in title)
+    return round(min(10.0, base_score + title_bonus + internship_bonus), 2)
+
+def reference_recency(days_old: pd.Series) -> pd.Series:
+    """Series recency score the vectorized version replaced."""
+    days_old = days_old.fillna(999).replace(999, 30)
+    return np.clip(1 - (days_old / 30), 0, 1)
+
+# Scraped text arrives Arrow-backed; plain object columns must score the same
+STRING_DTYPES = [object, pd.ArrowDtype(pa.string())]
+
+@pytest.fixture
+def scraper() -> InternshipScraper:
+    return InternshipScraper()
+
+@pytest.fixture
+def internship_filter() -> InternshipFilter:
+    return InternshipFilter()
+
+@pytest.mark.parametrize('dtype', STRING_DTYPES)
+def test_stipend_matches_reference(scraper, dtype):
+    title = JOBS['title'].astype(dtype).str.lower()
+    description = JOBS['description'].astype(dtype).str.lower()
+    expected = [reference_stipend(t, d) for t, d in zip(JOBS['title'], JOBS['description'])]
+
+    result = scraper._extract_stipend(title, description)
+
+    np.testing.assert_allclose(result.to_numpy(), expected)
+
+def test_stipend_converts_hourly_and_monthly_rates(scraper):
+    title = pd.Series(['intern', 'intern', 'intern'])
+    description = pd.Series(['25 per hour', '2,000 per month', 'no salary given'])
+
+    result = scraper._extract_stipend(title, description)
+
+    np.testing.assert_allclose(result.to_numpy(), [25 * 160 / 12, 2000.0, 0.0])
+
+def test_days_old_matches_reference(scraper):
+    now = datetime.now()
+    dates = pd.Series([
+        now - timedelta(days=3, hours=12),
+        now - timedelta(days=10, hours=1),
+        now + timedelta(days=2),  # Future dates count as brand new
+        None,
+        np.nan,
+        pd.NaT
+    ], dtype=object)
+    expected = [reference_days_old(date) for date in dates]
+
+    result = scraper._calculate_days_old(pd.DataFrame({'date_posted': dates}))
+
+    assert result.tolist() == expected
+    assert expected[-3:] == [999, 999, 999]
+
+def test_days_old_parses_date_strings(scraper):
+    date = (datetime.now() - timedelta(days=5, hours=12)).strftime('%Y-%m-%d %H:%M:%S')
+
+    result = scraper._calculate_days_old(pd.DataFrame({'date_posted': [date, 'not a date']}))
+
+    assert result.tolist() == [reference_days_old(date), 999]
+
+@pytest.mark.parametrize('dtype', STRING_DTYPES)
+def test_relevance_matches_reference_with_regex_metacharacters(scraper, dtype):
+    jobs = JOBS.astype(dtype)
+    title = jobs['title'].str.lower()
+    description = jobs['description'].str.lower()
+    expected = [
+        reference_relevance(t, d, c, SKILLS, scraper.internship_keywords)
+        for t, d, c in zip(JOBS['title'], JOBS['description'], JOBS['company'])
+    ]
+
+    result = scraper._calculate_relevance_score(jobs, title, description, SKILLS)
+
+    np.testing.assert_allclose(result.to_numpy(), expected, atol=1e-6)
+    # 'node.js' must not match 'nodexjs', and 'c++' must not match 'cpp'
+    assert result.iloc[3] == 0.0
+
+def test_recency_matches_reference(internship_filter):
+    days_old = pd.Series([0, 7, 15, 29, 30, 45, 999, np.nan])
+
+    result = internship_filter._calculate_recency_score(days_old)
+
+    np.testing.assert_allclose(result, reference_recency(days_old).to_numpy(), atol=1e-6)
+
+@pytest.mark.parametrize('company, expected', [
+    ('google', 1.0),
+    ('goldman sachs group', 1.0),
+    ('acme inc', 0.5),
+    ('acme corporation', 0.5),
+    ('dell technologies', 0.5),
+    ('techcorp', 0.5),
+    ('bank co', 0.5),
+    ('principal financial', 0.3),
+    ('random labs', 0.3),
+    ('unknown company', 0.3),
+    ('', 0.0)
+])
+def test_company_reputation(internship_filter, company, expected):
+    assert internship_filter._calculate_company_reputation(pd.Series([company]))[0] == expected
+
+def test_top_n_matches_full_sort(internship_filter):
+    rng = np.random.default_rng(0)
+    jobs = pd.DataFrame({
+        'title': [f'intern {i}' for i in range(50)],
+        'company': rng.choice(['Google', 'Acme Inc', 'Random Labs'], 50),
+        'location': 'Remote',
+        'apply_url': [f'https://example.com/{i}' for i in range(50)],
+        'stipend': rng.uniform(0, 5000, 50).round(2),
+        'days_old': rng.integers(0, 30, 50),
+        'relevance_score': rng.uniform(0, 10, 50).round(2)
+    })
+    scored = internship_filter._calculate_ranking_scores(jobs.copy(), SKILLS)
+    expected = scored.sort_values('final_score', ascending=False, kind='stable').head(10)
+
+    result = internship_filter.filter_and_rank(jobs, SKILLS, top_n=10)
+
+    assert result['final_score'].tolist() == expected['final_score'].tolist()
+    assert set(result.index) <= set(scored.index[scored['final_score'] >= expected['final_score'].min()])